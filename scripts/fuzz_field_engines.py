@@ -0,0 +1,252 @@
+"""Fuzz the optional field-extraction engines against plain re.
+
+FieldExtractor searches plain ASCII pages with PCRE2 or re2 and prefilters them
+with hyperscan when those packages are installed. Each is only used where it
+must match exactly like re, so this script checks:
+
+- extract_fields against re.search on random pages, for every combination of
+  hyperscan, pcre2 and re2 being installed and with ``linear_time`` on and off;
+- _compile_pcre2 and _compile_re2 against re on random patterns and texts, which
+  exercises the _PCRE_DIVERGENT, _CARET_ANCHOR and _REPEATED_GROUP exclusions.
+
+Run from the repository root with the optional engines installed:
+
+    python scripts/fuzz_field_engines.py [--seed N] [--pages N] [--patterns N]
+
+Each configuration runs in its own process, since engines are disabled by
+hiding their modules before temp is imported. Exits non-zero on any mismatch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+ENGINES = ("hyperscan", "pcre2", "re2")
+
+# (name, pattern, required, ascii) added to the default fields
+EXTRA_FIELDS: List[Tuple[str, str, bool, bool]] = [
+    ("optional_plural", r"Invoices? total", False, False),
+    ("required", r"ab+c", True, False),
+    ("word", r"Name:\s*(\w+)", False, False),
+    ("ascii_word", r"Name:\s*(\w+)", False, True),
+    ("space", r"A\sB", False, False),
+    ("end_of_text", r"end\Z", False, False),
+    ("end_of_line", r"(\d+)\s*$", False, False),
+    ("jit_miss", r"\$?x\d{2}", False, False),
+    ("caret", r"^Total(\w*)", False, False),
+    ("empty_line", r"^$", False, False),
+    ("blank_line", r"^\s*$", False, False),
+    ("last_word", r"^(\w*)$", False, False),
+    ("repeated_group", r"(a*)+b", False, False),
+    ("vertical_tab", r"a\vb", False, False),
+    ("not_boundary", r"\B", False, False),
+    ("posix_class", r"[[:alpha:]]+", False, False),
+    ("open_repeat", r"x{,2}y", False, False),
+]
+
+# Page fragments: field values, ASCII separators re counts as \s, non-ASCII text
+TOKENS = [
+    "x12", "$x12", "a\x0bb", "Total\n", "\n", "aab", "b", "Invoice Number: A1",
+    "INVOICE total", "invoices total", "abbbc", "ABC", "Date: 01/02/2024",
+    "Total Amount: $1.00", "ſtraße", "K", " ", "é", "Name: ", "José", "éx",
+    "A\x1cB", "A B", "end", "end\n", "12 ", "\r", "abc\r\n", ":alpha:", "xxy", "x{,2}y",
+]  # fmt: skip
+
+# Building blocks for random patterns, including syntax the engines read differently
+ATOMS = [
+    "a", "b", "A", "k", "s", "z", r"\w", r"\W", r"\s", r"\S", r"\d", r"\D",
+    r"\b", r"\B", ".", "^", "$", r"\A", "[a-c]", "[^ab]", "[Z-a]", "[]a]",
+    r"[\b]", r"[\s]", r"\v", r"\t", r"\n", r"\x41", r"\0", r"\012", "(?i)",
+    "(?s)", "(?m)", "(?-i:a)", "(?:ab|a)", "(a|ab)", "(a*)", "(a|b)+",
+    "(?P<n>a+)", "x{2}", "a{,2}", r"\.", ":", "-", " ", "(?:)", r"\?", r"\Z",
+    "[[:alpha:]]", r"\[^", "[^^]", r"[\d^]", r"(\d+ )*", "(a|b){2}", "(a?)+",
+    "(?:a*)+", r"\$?", "x", r"[\d,]+", r"\d{2}",
+]  # fmt: skip
+QUANTIFIERS = ["", "", "", "*", "+", "?", "*?", "+?", "??", "{1,2}", "{2}"]
+TEXT_CHARS = list("abAkszK :-.\n\t\x0c\r_019x$")
+
+Outcome = Union[Dict[str, str], str]
+
+
+def reference_fields(fields: List[Dict[str, Any]], text: str) -> Outcome:
+    """Return what extract_fields should produce for a page, using only re.
+
+    Returns:
+        The extracted fields, or the message of the exception it should raise.
+    """
+    results: Dict[str, str] = {}
+    missing_required: List[str] = []
+    for field in fields:
+        flags = re.IGNORECASE | re.MULTILINE | (re.ASCII if field["ascii"] else 0)
+        match = re.search(field["pattern"], text, flags)
+        if match:
+            value = match.group(1) if match.groups() else match.group(0)
+            results[field["name"]] = value
+        elif field["required"]:
+            missing_required.append(field["name"])
+    if missing_required:
+        return f"Missing required fields: {', '.join(missing_required)}"
+    return results
+
+
+def fuzz_fields(seed: int, pages: int, linear_time: bool) -> int:
+    """Compare extract_fields with reference_fields on random pages.
+
+    Returns:
+        The number of mismatching pages.
+    """
+    import temp
+
+    fields = [
+        {"name": "invoice_number", "pattern": r"Invoice\s*Number:\s*(\w+)"},
+        {"name": "date", "pattern": r"Date:\s*(\d{2}/\d{2}/\d{4})"},
+        {"name": "total_amount", "pattern": r"Total\s*Amount:\s*\$?([\d,]+\.\d{2})"},
+    ]
+    for field in fields:
+        field.update(required=False, ascii=False)
+    for name, pattern, required, ascii_only in EXTRA_FIELDS:
+        fields.append(
+            {
+                "name": name,
+                "pattern": pattern,
+                "required": required,
+                "ascii": ascii_only,
+            }
+        )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        config_path = os.path.join(config_dir, "pdf_extractor_config.json")
+        with open(config_path, "w") as f:
+            json.dump({"fields": fields, "linear_time": linear_time}, f)
+        extractor = temp.FieldExtractor(config_path)
+    engine_patterns = sum(
+        fast is not compiled
+        for fast, compiled in zip(extractor.ascii_patterns, extractor.patterns)
+    )
+    print(
+        f"  prefilter: {extractor.prefilter is not None}, "
+        f"PCRE2/re2 patterns: {engine_patterns}/{len(fields)}"
+    )
+
+    rng = random.Random(seed)
+    mismatches = 0
+    for _ in range(pages):
+        text = "".join(rng.choice(TOKENS) for _ in range(rng.randint(0, 9)))
+        expected = reference_fields(fields, text)
+        try:
+            actual: Outcome = extractor.extract_fields(text)
+        except Exception as e:
+            actual = str(e)
+        if actual != expected:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"  {text!r}: expected {expected}, got {actual}")
+    return mismatches
+
+
+def fuzz_engine(
+    seed: int, patterns: int, compile_engine: Callable[[str], Optional[Any]]
+) -> Tuple[int, int]:
+    """Compare an engine's compiled patterns with re on random patterns and texts.
+
+    Only patterns the engine accepts are checked, on plain ASCII texts as
+    extract_fields would pass them.
+
+    Returns:
+        Tuple of the number of patterns checked and the number that mismatched.
+    """
+    rng = random.Random(seed)
+    checked = mismatches = 0
+    for _ in range(patterns):
+        atoms = rng.randint(1, 4)
+        pattern = "".join(
+            rng.choice(ATOMS) + rng.choice(QUANTIFIERS) for _ in range(atoms)
+        )
+        try:
+            expected_pattern = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        except re.error:
+            continue
+        engine_pattern = compile_engine(pattern)
+        if engine_pattern is None:
+            continue
+        checked += 1
+        for _ in range(25):
+            text = "".join(rng.choice(TEXT_CHARS) for _ in range(rng.randint(0, 12)))
+            expected = expected_pattern.search(text)
+            actual = engine_pattern.search(text)
+            if (expected and (expected.span(), expected.groups())) != (
+                actual and (actual.span(), actual.groups())
+            ):
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"  {pattern!r} on {text!r}")
+                break
+    return checked, mismatches
+
+
+def run_configuration(args: argparse.Namespace) -> int:
+    """Run the checks for one configuration inside this process."""
+    for engine in args.without:
+        sys.modules[engine] = None  # type: ignore[assignment]
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # Random patterns include "[[" sets, which re warns about
+    warnings.simplefilter("ignore", FutureWarning)
+    import temp
+
+    mismatches = 0
+    for linear_time in (True, False):
+        failed = fuzz_fields(args.seed, args.pages, linear_time)
+        print(f"  extract_fields linear_time={linear_time}: {failed} mismatches")
+        mismatches += failed
+    if not args.without:
+        for name, compile_engine in (
+            ("pcre2", temp._compile_pcre2),
+            ("re2", temp._compile_re2),
+        ):
+            checked, failed = fuzz_engine(args.seed, args.patterns, compile_engine)
+            print(f"  {name}: {checked} patterns, {failed} mismatches")
+            mismatches += failed
+    return mismatches
+
+
+def main() -> int:
+    """Run every engine combination in a subprocess and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--pages", type=int, default=30000)
+    parser.add_argument("--patterns", type=int, default=40000)
+    parser.add_argument("--without", nargs="*", choices=ENGINES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.without is not None:
+        return 1 if run_configuration(args) else 0
+
+    failed = False
+    for count in range(len(ENGINES) + 1):
+        for without in itertools.combinations(ENGINES, count):
+            print(f"without {', '.join(without) or 'nothing'}:", flush=True)
+            command = [
+                sys.executable,
+                os.path.abspath(__file__),
+                f"--seed={args.seed}",
+                f"--pages={args.pages}",
+                f"--patterns={args.patterns}",
+                "--without",
+                *without,
+            ]
+            failed |= subprocess.run(command).returncode != 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,31 @@
+from __future__ import annotations
+
 import sys
 import os
 import csv
 import json
 import re
-from typing import List, Dict, Optional, Any, cast, Iterable, Tuple
+import multiprocessing
+import contextlib
+import hashlib
+import shutil
+import mmap
+import functools
+import queue
+import threading
+from typing import (
+    List,
+    Dict,
+    Optional,
+    Any,
+    Tuple,
+    Callable,
+    TextIO,
+    ContextManager,
+    Iterator,
+    Set,
+    TYPE_CHECKING,
+)
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -14,6 +36,7 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QWidget,
     QTextEdit,
+    QPlainTextEdit,
     QProgressBar,
     QListWidget,
     QListWidgetItem,
@@ -22,15 +45,132 @@ from PyQt5.QtWidgets import (
     QCheckBox,
     QMessageBox,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QPalette, QColor
-
-import pymupdf as fitz
+from PyQt5.QtCore import Qt, QThread, QObject, pyqtSignal
+from PyQt5.QtGui import QFont, QPalette, QColor, QCloseEvent
+
+if TYPE_CHECKING:
+    import pymupdf as fitz
+
+try:
+    from blake3 import blake3
+except ImportError:  # Optional: SIMD, multithreaded hashing for the extraction cache
+    blake3 = None
+
+try:
+    import hyperscan
+except ImportError:  # Optional: one-pass multi-pattern prefilter for field extraction
+    hyperscan = None
+
+try:
+    import pcre2
+except ImportError:  # Optional: faster regex engine for field extraction
+    pcre2 = None
+
+try:
+    import re2
+except ImportError:  # Optional: linear-time regex engine for field extraction
+    re2 = None
+
+# Pattern syntax PCRE (PCRE2, hyperscan) and re2 read differently from re: \Z also
+# matches before a final newline, "[:" starts a POSIX class, and "{,n}" may be literal
+_PCRE_DIVERGENT = ("\\Z", "[:", "{,")
+# re counts these as \s in str patterns; PCRE does not count \x1c-\x1f, re2 not \v
+_RE_ONLY_SPACES = re.compile(r"[\x0b\x1c-\x1f]")
+# A "^" anchor, as opposed to a "[^" negated class; PCRE2 and hyperscan don't match
+# "^" after a trailing newline
+_CARET_ANCHOR = re.compile(r"(?<!\[)\^|\\\[\^")
+# A quantified group; re2 captures differ from re when an iteration matches empty
+_REPEATED_GROUP = re.compile(r"\)[*+{]")
+
+
+def _pcre_compatible(pattern: str) -> bool:
+    """Return whether PCRE-based engines read a pattern like re on plain ASCII text.
+
+    On non-ASCII text the engines disagree on word characters and case folding,
+    so callers only use them when the text is ASCII without \\v or \\x1c-\\x1f.
+    This is enough for the hyperscan prefilter; _compile_pcre2 and _compile_re2
+    also rule out the constructs their engine reports differently.
+    """
+    return pattern.isascii() and not any(token in pattern for token in _PCRE_DIVERGENT)
+
+
+def _compile_pcre2(pattern: str) -> Optional[Any]:
+    """Compile a pattern with PCRE2 if it matches like re on plain ASCII text.
+
+    PCRE2 reads \\v as any vertical space and lets \\B match empty text, so
+    those patterns and "^" anchors are left to re.
+
+    Returns:
+        The PCRE2 pattern, or None if pcre2 is missing or can't match it exactly.
+    """
+    if (
+        pcre2 is None
+        or not _pcre_compatible(pattern)
+        or "\\v" in pattern
+        or "\\B" in pattern
+        or _CARET_ANCHOR.search(pattern)
+    ):
+        return None
+    try:
+        # Not JIT-compiled: PCRE2 10.47's JIT misses matches the interpreter finds,
+        # e.g. r"\$?x\d{2}" in "x12", and the interpreter is already faster than re
+        return pcre2.compile(pattern, flags=pcre2.I | pcre2.M, jit=False)
+    except pcre2.LibraryError:
+        return None
+
+
+def _compile_re2(pattern: str) -> Optional[Any]:
+    """Compile a pattern with re2 if it matches like re on plain ASCII text.
+
+    re2 lets \\B match empty text and reports different captures for a repeated
+    group whose last iteration is empty, so those patterns are left to re.
+    Patterns re2 doesn't support, such as backreferences and lookarounds,
+    are left to re too.
+
+    Returns:
+        The re2 pattern, or None if re2 is missing or can't match it exactly.
+    """
+    if (
+        re2 is None
+        or not _pcre_compatible(pattern)
+        or "\\B" in pattern
+        or _REPEATED_GROUP.search(pattern)
+    ):
+        return None
+    options = re2.Options()
+    options.case_sensitive = False
+    options.log_errors = False
+    try:
+        return re2.compile("(?m)" + pattern, options)
+    except re2.error:
+        return None
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the literal text every match of a pattern must start with, lowercased.
+
+    Only plain ASCII characters before the first regex metacharacter count, and
+    patterns with alternation or leading inline flags (e.g. verbose mode) have no
+    prefix. A character made optional by a following quantifier is dropped.
+    """
+    if "|" in pattern or pattern.startswith("(?") or not pattern.isascii():
+        return ""
+    prefix: List[str] = []
+    for char in pattern:
+        if char in ".^$*+?{}[]()\\":
+            if char in "*?{" and prefix:
+                prefix.pop()
+            break
+        prefix.append(char)
+    return "".join(prefix).lower()
 
 
 class FieldExtractor:
     """Handles configuration and extraction of specific fields from text using regex patterns."""
 
+    # Flags applied to every field pattern
+    PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
     def __init__(self, config_path: Optional[str] = None) -> None:
         """Initialize the FieldExtractor with optional custom config path.
 
@@ -38,6 +178,18 @@ class FieldExtractor:
             config_path: Path to JSON configuration file. Defaults to 'pdf_extractor_config.json'.
         """
         self.fields: List[Dict[str, Any]] = []
+        self.patterns: List[re.Pattern[str]] = []
+        # Patterns used on plain ASCII text, from PCRE2 or re2 where they match like re
+        self.ascii_patterns: List[Any] = []
+        self.prefixes: List[str] = []
+        self.prefilter: Optional[Any] = None
+        # Fields left out of the prefilter, which are always searched
+        self.unfiltered: Set[int] = set()
+        # On plain ASCII pages, prefer re2, which can't backtrack catastrophically,
+        # over PCRE2; other pages always use re
+        self.linear_time = True
+        # Set when fields are edited; patterns are recompiled on the next extraction
+        self.dirty = False
         self.config_path = config_path or "pdf_extractor_config.json"
         self.load_config()
 
@@ -52,6 +204,7 @@ class FieldExtractor:
                 with open(self.config_path, "r") as f:
                     config: Dict[str, Any] = json.load(f)
                     self.fields = config.get("fields", [])
+                    self.linear_time = config.get("linear_time", True)
             else:
                 # Create default config if doesn't exist
                 self.fields = [
@@ -72,9 +225,131 @@ class FieldExtractor:
                     },
                 ]
                 self.save_config()
+            self.compile_patterns()
         except Exception as e:
             raise Exception(f"Error loading config: {str(e)}")
 
+    def compile_patterns(self) -> None:
+        """Compile each field's pattern once instead of on every extraction.
+
+        The compiled patterns live in a list parallel to ``fields`` so the field
+        dictionaries stay plain JSON. After editing ``fields``, call
+        invalidate_patterns() and they are recompiled on the next extraction.
+
+        Raises:
+            Exception: If a field's pattern is not a valid regular expression.
+        """
+        patterns: List[re.Pattern[str]] = []
+        for field in self.fields:
+            try:
+                flags = self.get_pattern_flags(field.get("ascii", False))
+                patterns.append(re.compile(field.get("pattern", ""), flags))
+            except (re.error, ValueError) as e:
+                raise Exception(f"Error compiling field '{field['name']}': {str(e)}")
+        self.patterns = patterns
+        self.ascii_patterns = self.compile_ascii_patterns()
+        self.prefixes = [
+            _literal_prefix(field.get("pattern", "")) for field in self.fields
+        ]
+        self.prefilter = self.compile_prefilter()
+        self.dirty = False
+
+    def compile_ascii_patterns(self) -> List[Any]:
+        """Compile the field patterns with PCRE2 or re2 where they match like re.
+
+        These patterns are only used on plain ASCII text. With ``linear_time``
+        set, re2 is tried first so that no pattern it accepts can backtrack
+        catastrophically; otherwise PCRE2, which is usually faster, is tried
+        first. Fields neither engine can match exactly keep their re pattern.
+
+        Returns:
+            A list parallel to ``patterns``, or ``patterns`` itself without either.
+        """
+        if pcre2 is None and re2 is None:
+            return self.patterns
+        if self.linear_time:
+            engines = (_compile_re2, _compile_pcre2)
+        else:
+            engines = (_compile_pcre2, _compile_re2)
+        ascii_patterns: List[Any] = []
+        for field, compiled in zip(self.fields, self.patterns):
+            pattern = field.get("pattern", "")
+            for engine in engines:
+                fast = engine(pattern)
+                if fast is not None:
+                    ascii_patterns.append(fast)
+                    break
+            else:
+                ascii_patterns.append(compiled)
+        return ascii_patterns
+
+    def invalidate_patterns(self) -> None:
+        """Mark the compiled patterns stale after ``fields`` has been edited."""
+        self.dirty = True
+
+    @classmethod
+    def get_pattern_flags(cls, ascii_only: bool) -> int:
+        """Return the regex flags for a field.
+
+        Fields marked "ascii" in the config add re.ASCII: word, digit and space
+        classes and case folding then use ASCII rules instead of Unicode tables,
+        which is faster but no longer matches non-ASCII letters or digits.
+        """
+        return cls.PATTERN_FLAGS | re.ASCII if ascii_only else cls.PATTERN_FLAGS
+
+    def compile_prefilter(self) -> Optional[Any]:
+        """Compile all field patterns into one hyperscan database, if available.
+
+        Prefilter mode may report fields that don't really match but never misses
+        one that does, so a single scan narrows which patterns re has to run. It
+        is only used on plain ASCII text; fields whose patterns are not
+        _pcre_compatible or use a "^" anchor are left out and always searched.
+
+        Returns:
+            The database, or None if hyperscan is missing or rejects a pattern.
+        """
+        ids = [
+            index
+            for index, field in enumerate(self.fields)
+            if _pcre_compatible(field.get("pattern", ""))
+            and not _CARET_ANCHOR.search(field.get("pattern", ""))
+        ]
+        self.unfiltered = set(range(len(self.fields))).difference(ids)
+        if hyperscan is None or not ids:
+            return None
+        flags = (
+            hyperscan.HS_FLAG_CASELESS
+            | hyperscan.HS_FLAG_MULTILINE
+            | hyperscan.HS_FLAG_PREFILTER
+            | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_ALLOWEMPTY
+        )
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[self.fields[index]["pattern"].encode() for index in ids],
+                ids=ids,
+                elements=len(ids),
+                flags=flags,
+            )
+        except hyperscan.error:
+            return None
+        return database
+
+    def find_candidates(self, text: str) -> Optional[Set[int]]:
+        """Return the indexes of the fields that may match plain ASCII text.
+
+        Returns:
+            The candidate indexes, or None to search every field.
+        """
+        if self.prefilter is None:
+            return None
+        candidates = set(self.unfiltered)
+        self.prefilter.scan(
+            text.encode(), match_event_handler=lambda index, *_: candidates.add(index)
+        )
+        return candidates
+
     def save_config(self) -> None:
         """Save current field configuration to JSON file.
 
@@ -83,7 +358,11 @@ class FieldExtractor:
         """
         try:
             with open(self.config_path, "w") as f:
-                json.dump({"fields": self.fields}, f, indent=4)
+                json.dump(
+                    {"fields": self.fields, "linear_time": self.linear_time},
+                    f,
+                    indent=4,
+                )
         except Exception as e:
             raise Exception(f"Error saving config: {str(e)}")
 
@@ -99,19 +378,34 @@ class FieldExtractor:
         Raises:
             Exception: If required fields are missing or pattern processing fails.
         """
+        if self.dirty:
+            self.compile_patterns()
         results: Dict[str, str] = {}
         missing_required: List[str] = []
 
-        for field in self.fields:
+        is_ascii = text.isascii()
+        # PCRE2, re2 and hyperscan only match exactly like re on plain ASCII text
+        plain_ascii = is_ascii and not _RE_ONLY_SPACES.search(text)
+        candidates = self.find_candidates(text) if plain_ascii else None
+        patterns = self.ascii_patterns if plain_ascii else self.patterns
+        # Without hyperscan, literal prefixes rule out fields with a cheap substring
+        # check; lower() only matches re's case folding for ASCII text
+        text_lower = text.lower() if candidates is None and is_ascii else None
+        for index, field in enumerate(self.fields):
+            required = field.get("required", False)
+            if missing_required and not required:
+                # The page is rejected anyway; only the missing required fields matter
+                continue
             try:
-                pattern: str = field.get("pattern", "")
-                matches = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+                matches = self.search_field(
+                    index, text, patterns, candidates, text_lower
+                )
                 if matches:
                     # Use the first capture group if exists, else the whole match
                     results[field["name"]] = (
                         matches.group(1) if matches.groups() else matches.group(0)
                     )
-                elif field.get("required", False):
+                elif required:
                     missing_required.append(field["name"])
             except Exception as e:
                 raise Exception(f"Error processing field '{field['name']}': {str(e)}")
@@ -121,104 +415,409 @@ class FieldExtractor:
 
         return results
 
+    def search_field(
+        self,
+        index: int,
+        text: str,
+        patterns: List[Any],
+        candidates: Optional[Set[int]],
+        text_lower: Optional[str],
+    ) -> Optional[Any]:
+        """Search text for one field unless a prefilter rules it out."""
+        if candidates is not None and index not in candidates:
+            return None
+        prefix = self.prefixes[index]
+        if text_lower is not None and prefix and prefix not in text_lower:
+            return None
+        return patterns[index].search(text)
+
+
+# Part of every cache key; bump it whenever the output for the same PDF and options
+# changes, so entries written by older code are no longer used
+CACHE_VERSION = 1
+
+
+def _file_fingerprint(path: str) -> str:
+    """Return a hex digest of a file's contents.
+
+    Uses BLAKE3 across all cores when the blake3 package is installed, otherwise
+    SHA-256. hashlib.file_digest reads straight into a reusable buffer, avoiding
+    a Python-level chunk loop.
+    """
+    with open(path, "rb", buffering=0) as f:
+        if blake3 is not None:
+            digest = hashlib.file_digest(f, lambda: blake3(max_threads=blake3.AUTO))
+        else:
+            digest = hashlib.file_digest(f, "sha256")
+    return digest.hexdigest()
 
-class PDFExtractorThread(QThread):
-    """Worker thread for PDF extraction to prevent UI freezing."""
 
-    progress_update = pyqtSignal(int)
-    extraction_complete = pyqtSignal(str, list)
-    extraction_error = pyqtSignal(str)
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write a complete byte blob to a file through an unbuffered descriptor.
+
+    The blob is already in memory, so Python's buffered writer would only add
+    an extra copy; O_BINARY keeps Windows from translating line endings. Any
+    existing file is removed first: it may be a hard link left by an earlier
+    run, and truncating it would overwrite every other name linked to it.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link dst to src, falling back to a copy where links are unsupported.
+
+    Any existing dst is removed first so a link left by an earlier run is never
+    written through.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+_FileWrite = Tuple[Callable[..., None], Tuple[Any, ...]]
+
+
+class _ImageWriter:
+    """Run a page's image writes on a background thread while the next page is parsed.
+
+    Writes are queued one page at a time and run in order on a single thread, so
+    a hard link is always created after the file it points to. The queue is
+    bounded so decoded image bytes cannot pile up faster than the disk drains them.
+    """
+
+    MAX_PENDING_PAGES = 4
+
+    def __init__(self) -> None:
+        self.queue: queue.Queue[Optional[List[_FileWrite]]] = queue.Queue(
+            self.MAX_PENDING_PAGES
+        )
+        self.error: Optional[BaseException] = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def __enter__(self) -> _ImageWriter:
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.queue.put(None)
+        self.thread.join()
+        if exc_type is None and self.error is not None:
+            raise self.error
+
+    def run(self) -> None:
+        """Run queued writes until the None sentinel, keeping the first error."""
+        while (writes := self.queue.get()) is not None:
+            if self.error is not None:
+                continue
+            try:
+                for write, args in writes:
+                    write(*args)
+            except Exception as e:
+                self.error = e
+
+    def submit(self, writes: List[_FileWrite]) -> None:
+        """Queue a page's writes, blocking while the queue is full."""
+        if self.error is not None:
+            raise self.error
+        if writes:
+            self.queue.put(writes)
+
+
+@contextlib.contextmanager
+def _open_pdf(pdf_path: str) -> Iterator[fitz.Document]:
+    """Open a PDF backed by a read-only memory map of the file.
+
+    MuPDF reads the mapped bytes in place, so objects are paged in on demand
+    rather than copied through buffered file reads. Falls back to opening by
+    path when the file cannot be mapped (empty, or too large for the address
+    space on 32-bit builds).
+    """
+    # Imported on first use: loading MuPDF is the slowest part of startup
+    import pymupdf as fitz
+
+    try:
+        with open(pdf_path, "rb") as pdf_file:
+            mapped = mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, OverflowError):
+        with fitz.open(pdf_path) as doc:
+            yield doc
+        return
+
+    view = memoryview(mapped)
+    try:
+        doc = fitz.open(stream=view, filetype="pdf")
+        try:
+            yield doc
+        finally:
+            doc.close()
+    finally:
+        view.release()
+        mapped.close()
+
+
+class PDFProcessor:
+    """Extracts text, field data and images from PDF files into an output directory.
+
+    Holds no Qt state so the same pipeline can run in the extraction thread or in
+    a worker process.
+    """
+
+    # Pages between trims of MuPDF's object store while processing a document
+    STORE_SHRINK_INTERVAL = 64
 
     def __init__(
         self,
-        pdf_paths: List[str],
         output_path: str,
         extract_text: bool = True,
         extract_images: bool = False,
         export_csv: bool = False,
+        field_extractor: Optional[FieldExtractor] = None,
+        page_callback: Optional[Callable[[int, int], None]] = None,
+        use_cache: bool = True,
     ) -> None:
-        """Initialize the PDF extraction thread.
+        """Initialize the PDF processor.
 
         Args:
-            pdf_paths: List of PDF file paths to process.
             output_path: Directory to save extracted content.
             extract_text: Whether to extract raw text.
             extract_images: Whether to extract images.
             export_csv: Whether to export data as CSV.
+            field_extractor: Extractor used for CSV fields. Loads the default config if omitted.
+            page_callback: Called with (page_num, total_pages) after each page is processed.
+            use_cache: Whether to reuse and store results in the output's .cache folder.
         """
-        super().__init__()
-        self.pdf_paths = pdf_paths
         self.output_path = output_path
         self.extract_text = extract_text
         self.extract_images = extract_images
         self.export_csv = export_csv
-        self.field_extractor = FieldExtractor()
+        self.field_extractor = field_extractor or FieldExtractor()
+        self.page_callback = page_callback
+        self.use_cache = use_cache
+        # Image output directory with a trailing separator, so names append directly
+        self.images_dir_sep = os.path.join(output_path, "images", "")
+        # Names of the images written by the last process_pdf_pages call
+        self.image_files: List[str] = []
+        # First file written for each image xref in the current document
+        self.seen_xrefs: Dict[int, str] = {}
+        # First file written for each distinct image content in the current document
+        self.image_digests: Dict[bytes, str] = {}
+        # Page numbers skipped from the CSV, by warning message
+        self.csv_warnings: Dict[str, List[int]] = {}
+
+    def process_pdf(self, pdf_path: str) -> str:
+        """Process a single PDF file.
 
-    def run(self) -> None:
-        """Main execution method for the thread, performs the PDF extraction."""
-        processed_files: List[str] = []
-        try:
-            total_pdfs = len(self.pdf_paths)
-            for pdf_index, pdf_path in enumerate(self.pdf_paths):
-                processed_files.append(
-                    self.process_single_pdf(pdf_index, pdf_path, total_pdfs)
-                )
-
-            self.emit_completion_result(processed_files, total_pdfs)
-        except Exception as e:
-            self.extraction_error.emit(f"Error extracting PDFs: {str(e)}")
-
-    def process_single_pdf(self, pdf_index: int, pdf_path: str, total_pdfs: int) -> str:
-        """Process a single PDF file and return its base name."""
-        with fitz.open(pdf_path) as doc:
-            base_name = self.get_base_name(pdf_path)
-            extracted_text, csv_data = self.process_pdf_pages(
-                doc, base_name, pdf_index, total_pdfs
+        Returns:
+            The PDF base name.
+        """
+        base_name = self.get_base_name(pdf_path)
+        cache_dir = self.get_cache_dir(pdf_path, base_name)
+        if cache_dir is not None and os.path.isdir(cache_dir):
+            self.restore_from_cache(cache_dir)
+            return base_name
+
+        with _open_pdf(pdf_path) as doc, self.open_text_file(base_name) as text_file:
+            _, csv_data = self.process_pdf_pages(doc, base_name, text_file)
+        self.save_output_files(base_name, csv_data)
+        if cache_dir is not None:
+            self.store_in_cache(
+                cache_dir, self.get_output_files(base_name, csv_data, self.image_files)
             )
-            self.save_output_files(base_name, extracted_text, csv_data)
-        return f"{base_name}.pdf"
+        return base_name
 
     def get_base_name(self, pdf_path: str) -> str:
         """Extract the base filename without extension."""
         return os.path.splitext(os.path.basename(pdf_path))[0]
 
+    def get_cache_dir(self, pdf_path: str, base_name: str) -> Optional[str]:
+        """Return the cache directory for a PDF, keyed by its contents and the options.
+
+        The base name is part of the key because it appears in the output file
+        names, text headers and CSV rows; the field config only matters for CSV.
+        CACHE_VERSION and the MuPDF version are included so that code changes
+        which alter the output never reuse older entries.
+
+        Returns:
+            The directory, or None if caching is disabled.
+        """
+        if not self.use_cache:
+            return None
+        import pymupdf as fitz
+
+        fields = (
+            json.dumps(self.field_extractor.fields, sort_keys=True)
+            if self.export_csv
+            else ""
+        )
+        key_source = (
+            f"{CACHE_VERSION}|{fitz.VersionBind}|{_file_fingerprint(pdf_path)}|"
+            f"{base_name}|{self.extract_text}|{self.extract_images}|"
+            f"{self.export_csv}|{fields}"
+        )
+        cache_key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+        return os.path.join(self.output_path, ".cache", cache_key)
+
+    def get_output_files(
+        self, base_name: str, csv_data: List[Dict[str, Any]], image_files: List[str]
+    ) -> List[str]:
+        """Return the output files written for a PDF, relative to the output path."""
+        output_files = [os.path.join("images", name) for name in image_files]
+        if self.extract_text:
+            output_files.append(f"{base_name}_text.txt")
+        if self.export_csv and csv_data:
+            output_files.append(f"{base_name}_data.csv")
+        return output_files
+
+    def store_in_cache(self, cache_dir: str, output_files: List[str]) -> None:
+        """Copy a PDF's output files into its cache directory.
+
+        Files are staged in a temporary directory that is renamed into place, so a
+        cache entry is either complete or absent. Failures only skip caching.
+        """
+        staging_dir = f"{cache_dir}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(staging_dir, exist_ok=True)
+            for relative_path in output_files:
+                cached_path = os.path.join(staging_dir, relative_path)
+                os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+                shutil.copyfile(
+                    os.path.join(self.output_path, relative_path), cached_path
+                )
+            os.rename(staging_dir, cache_dir)
+        except OSError as e:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            if not os.path.isdir(cache_dir):
+                print(f"Warning caching {os.path.basename(cache_dir)}: {str(e)}")
+
+    def restore_from_cache(self, cache_dir: str) -> None:
+        """Copy cached output files into the output path.
+
+        Existing outputs are removed rather than overwritten, since they may be
+        hard links shared with other images.
+        """
+        for root, _, files in os.walk(cache_dir):
+            relative_root = os.path.relpath(root, cache_dir)
+            output_root = os.path.normpath(
+                os.path.join(self.output_path, relative_root)
+            )
+            os.makedirs(output_root, exist_ok=True)
+            for name in files:
+                output_file = os.path.join(output_root, name)
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(output_file)
+                shutil.copyfile(os.path.join(root, name), output_file)
+
     def process_pdf_pages(
-        self, doc: fitz.Document, base_name: str, pdf_index: int, total_pdfs: int
+        self,
+        doc: fitz.Document,
+        base_name: str,
+        text_file: Optional[TextIO] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
     ) -> Tuple[str, List[Dict[str, Any]]]:
-        """Process all pages in a PDF document."""
-        extracted_text = ""
-        csv_data = []
+        """Process the pages in [start, stop) of a PDF document, all pages by default.
+
+        Page text is streamed to text_file when given, otherwise it is collected
+        and returned.
+        """
+        text_parts: Optional[List[str]] = [] if text_file is None else None
+        csv_data: List[Dict[str, Any]] = []
+        self.image_files = []
+        self.seen_xrefs = {}
+        self.image_digests = {}
+        self.csv_warnings = {}
         total_pages = len(doc)
 
         if self.extract_images:
             self.setup_images_directory(base_name)
 
-        for page_num, page in enumerate(cast(Iterable[Any], doc)):
-            page_text = page.get_text()
-            extracted_text = self.process_page_text(
-                extracted_text, base_name, page_num, page_text
-            )
-            csv_data = self.process_page_csv(csv_data, base_name, page_num, page_text)
-            self.process_page_images(page, base_name, page_num)
-            self.update_progress(pdf_index, page_num, total_pages, total_pdfs)
-
+        stop = total_pages if stop is None else stop
+        with self.open_image_writer() as image_writer:
+            for page_num in range(start, stop):
+                # Load pages one at a time and drop each before the next is loaded
+                page = doc.load_page(page_num)
+                try:
+                    page_text = self.get_page_text(page)
+                    self.process_page_text(
+                        text_file, text_parts, base_name, page_num, page_text
+                    )
+                    self.process_page_csv(csv_data, base_name, page_num, page_text)
+                    self.process_page_images(
+                        doc, page, base_name, page_num, image_writer
+                    )
+                finally:
+                    del page
+                if (page_num + 1) % self.STORE_SHRINK_INTERVAL == 0:
+                    self.shrink_store()
+                if self.page_callback:
+                    self.page_callback(page_num, total_pages)
+
+        self.report_csv_warnings(base_name)
+        extracted_text = "".join(text_parts) if self.extract_text and text_parts else ""
         return extracted_text, csv_data
 
     def setup_images_directory(self, base_name: str) -> None:
         """Create directory for images if needed."""
-        images_dir = os.path.join(self.output_path, "images")
-        os.makedirs(images_dir, exist_ok=True)
+        os.makedirs(self.images_dir_sep, exist_ok=True)
+
+    def shrink_store(self) -> None:
+        """Empty MuPDF's cache of decoded objects (fonts, images, content streams).
+
+        The store otherwise grows towards its 256 MB cap over a long document;
+        trimming it keeps memory flat at the cost of re-decoding shared objects.
+        """
+        import pymupdf as fitz
+
+        fitz.TOOLS.store_shrink(100)
+
+    def get_page_text(self, page: fitz.Page) -> str:
+        """Return the text of a page, or "" when only images are exported."""
+        if not (self.extract_text or self.export_csv):
+            return ""
+        return page.get_text()
+
+    def open_text_file(self, base_name: str) -> ContextManager[Optional[TextIO]]:
+        """Open the buffered output text file, or a null context if text is not extracted."""
+        if not self.extract_text:
+            return contextlib.nullcontext()
+        return open(
+            self.get_text_file_path(base_name),
+            "w",
+            encoding="utf-8",
+            buffering=1024 * 1024,
+        )
+
+    def get_text_file_path(self, base_name: str) -> str:
+        """Return the path of the text file written for a PDF."""
+        return os.path.join(self.output_path, f"{base_name}_text.txt")
 
     def process_page_text(
-        self, current_text: str, base_name: str, page_num: int, page_text: str
-    ) -> str:
-        """Process and append text for a single page."""
-        if self.extract_text or self.export_csv:
-            return (
-                current_text
-                + f"--- {base_name} - Page {page_num + 1} ---\n{page_text}\n\n"
-            )
-        return current_text
+        self,
+        text_file: Optional[TextIO],
+        text_parts: Optional[List[str]],
+        base_name: str,
+        page_num: int,
+        page_text: str,
+    ) -> None:
+        """Write the text for a single page to the text file and/or the kept text parts."""
+        if self.extract_text:
+            chunks = (f"--- {base_name} - Page {page_num + 1} ---\n", page_text, "\n\n")
+            if text_file is not None:
+                text_file.writelines(chunks)
+            if text_parts is not None:
+                text_parts.extend(chunks)
 
     def process_page_csv(
         self,
@@ -226,90 +825,510 @@ class PDFExtractorThread(QThread):
         base_name: str,
         page_num: int,
         page_text: str,
-    ) -> List[Dict[str, Any]]:
-        """Process CSV data for a single page."""
+    ) -> None:
+        """Process CSV data for a single page, appending its row to csv_data."""
         if not self.export_csv:
-            return csv_data
+            return
 
         try:
             fields = self.field_extractor.extract_fields(page_text)
             row = {"File": base_name, "Page": page_num + 1}
             row.update(fields)
-            return csv_data + [row]
+            csv_data.append(row)
         except Exception as e:
-            print(f"Warning processing page {page_num + 1}: {str(e)}")
-            return csv_data
+            self.csv_warnings.setdefault(str(e), []).append(page_num + 1)
+
+    def report_csv_warnings(self, base_name: str) -> None:
+        """Print one warning per distinct CSV error instead of one per page.
+
+        Most pages of a multi-page document lack the required fields, so printing
+        per page would flood (and, on Windows consoles, slow down) the run.
+        """
+        for message, pages in self.csv_warnings.items():
+            page_list = ", ".join(map(str, pages))
+            print(f"Warning processing {base_name} pages {page_list}: {message}")
+
+    def open_image_writer(self) -> ContextManager[Optional[_ImageWriter]]:
+        """Start the background image writer, or a null context without images."""
+        if not self.extract_images:
+            return contextlib.nullcontext()
+        return _ImageWriter()
 
     def process_page_images(
-        self, page: fitz.Page, base_name: str, page_num: int
+        self,
+        doc: fitz.Document,
+        page: fitz.Page,
+        base_name: str,
+        page_num: int,
+        image_writer: Optional[_ImageWriter] = None,
     ) -> None:
-        """Extract images from a single page."""
+        """Extract images from a single page.
+
+        Images are decoded here, but their files are written by image_writer when
+        given, so the disk writes overlap with parsing the following pages.
+        """
         if not self.extract_images:
             return
 
-        images_dir = os.path.join(self.output_path, "images")
-        for img_index, img_info in enumerate(page.get_images(full=True)):
-            self.save_page_image(img_info, base_name, page_num, img_index, images_dir)
+        # Built once per page rather than once per image
+        page_prefix = f"{base_name}_page{page_num + 1}_img"
+        writes: List[_FileWrite] = []
+        # Only the xref is used, so skip the referencer xref full=True adds
+        for img_index, img_info in enumerate(page.get_images(full=False)):
+            writes.append(self.save_page_image(doc, img_info, page_prefix, img_index))
+        if image_writer is not None:
+            image_writer.submit(writes)
+        else:
+            for write, args in writes:
+                write(*args)
 
     def save_page_image(
         self,
+        doc: fitz.Document,
         img_info: Tuple,
-        base_name: str,
-        page_num: int,
+        page_prefix: str,
         img_index: int,
-        images_dir: str,
-    ) -> None:
-        """Save a single image from a page."""
+    ) -> _FileWrite:
+        """Decode a single image from a page and name its file.
+
+        Images shared across pages (logos, headers) are decoded and written only
+        once per document; later occurrences are hard links to that first file.
+        Images with identical bytes under different xrefs are linked by write_image.
+
+        Returns:
+            The write that saves the image, as a (function, args) pair.
+        """
+        images_dir_sep = self.images_dir_sep
         xref = img_info[0]
-        base_image = img_info[1].extract_image(xref)
-        image_filename = (
-            f"{base_name}_page{page_num + 1}_img{img_index + 1}.{base_image['ext']}"
-        )
-        with open(os.path.join(images_dir, image_filename), "wb") as img_file:
-            img_file.write(base_image["image"])
+        seen_filename = self.seen_xrefs.get(xref)
+        if seen_filename is not None:
+            image_ext = os.path.splitext(seen_filename)[1]
+            image_filename = f"{page_prefix}{img_index + 1}{image_ext}"
+            write: _FileWrite = (
+                _link_or_copy,
+                (images_dir_sep + seen_filename, images_dir_sep + image_filename),
+            )
+        else:
+            base_image = doc.extract_image(xref)
+            image_filename = f"{page_prefix}{img_index + 1}.{base_image['ext']}"
+            write = (
+                self.write_image,
+                (images_dir_sep + image_filename, base_image["image"]),
+            )
+            self.seen_xrefs[xref] = image_filename
+        self.image_files.append(image_filename)
+        return write
+
+    def write_image(self, path: str, data: bytes) -> None:
+        """Write an image file, or hard-link it to an earlier image with the same bytes.
+
+        Catches the same picture stored under several xrefs (common in merged
+        PDFs), which the xref check in save_page_image cannot see. Runs on the
+        image writer thread, where hashing overlaps with parsing the next pages.
+        Both paths replace the file at ``path`` rather than write into it, since
+        an earlier run may have linked it to images that now differ.
+        """
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        first_path = self.image_digests.get(digest)
+        if first_path is None:
+            self.image_digests[digest] = path
+            _write_bytes(path, data)
+        else:
+            _link_or_copy(first_path, path)
 
-    def save_output_files(
-        self, base_name: str, extracted_text: str, csv_data: List[Dict[str, Any]]
-    ) -> None:
-        """Save all output files for a single PDF."""
-        if self.extract_text and extracted_text:
-            self.save_text_file(base_name, extracted_text)
+    def save_output_files(self, base_name: str, csv_data: List[Dict[str, Any]]) -> None:
+        """Save the remaining output files for a single PDF once all pages are done."""
         if self.export_csv and csv_data:
             self.save_csv_file(base_name, csv_data)
 
-    def save_text_file(self, base_name: str, text_content: str) -> None:
-        """Save extracted text to file."""
-        text_file_path = os.path.join(self.output_path, f"{base_name}_text.txt")
-        with open(text_file_path, "w", encoding="utf-8") as text_file:
-            text_file.write(text_content)
-
     def save_csv_file(self, base_name: str, csv_data: List[Dict[str, Any]]) -> None:
-        """Save CSV data to file."""
+        """Save CSV data to file.
+
+        Every column found in at least one row is written, in sorted order. Rows
+        are written as lists, which skips DictWriter's per-row key validation.
+        """
         csv_file_path = os.path.join(self.output_path, f"{base_name}_data.csv")
-        fieldnames = sorted({field for row in csv_data for field in row.keys()})
+        fieldnames = sorted(set().union(*csv_data))
+
+        with open(
+            csv_file_path, "w", newline="", encoding="utf-8", buffering=1024 * 1024
+        ) as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                [row.get(name, "") for name in fieldnames] for row in csv_data
+            )
+
+
+# (output_path, extract_text, extract_images, export_csv, config_path, use_cache)
+ProcessorOptions = Tuple[str, bool, bool, bool, str, bool]
+
+
+@functools.cache
+def _build_processor(options: ProcessorOptions) -> PDFProcessor:
+    """Create a PDFProcessor inside a worker process from picklable options.
+
+    Cached so each worker loads the field config and compiles its patterns once,
+    not once per task; pools are created per run, so edits are still picked up.
+    """
+    output_path, extract_text, extract_images, export_csv, config_path, use_cache = (
+        options
+    )
+    return PDFProcessor(
+        output_path,
+        extract_text,
+        extract_images,
+        export_csv,
+        FieldExtractor(config_path),
+        use_cache=use_cache,
+    )
+
+
+def _extract_pdf_group(args: Tuple[List[str], ProcessorOptions]) -> List[str]:
+    """Worker-process entry point that extracts PDFs sharing a base name, in order.
+
+    PDFs with the same base name write the same output files and cache entries,
+    so they are never run concurrently; as in a sequential run, the last one wins.
+
+    Args:
+        args: Tuple of (pdf_paths, options).
+
+    Returns:
+        The PDF base names, in processing order.
+    """
+    pdf_paths, options = args
+    processor = _build_processor(options)
+    return [processor.process_pdf(pdf_path) for pdf_path in pdf_paths]
+
+
+def _extract_page_range(
+    args: Tuple[str, int, int, ProcessorOptions],
+) -> Tuple[int, str, List[Dict[str, Any]], List[str]]:
+    """Worker-process entry point that extracts pages [seg_from, seg_to) of a PDF.
+
+    Each worker opens its own document; images are written directly while the
+    text and CSV rows are returned for the parent to assemble in page order.
+
+    Args:
+        args: Tuple of (pdf_path, seg_from, seg_to, options).
+
+    Returns:
+        Tuple of the first page index, the extracted text, the CSV rows and the
+        names of the images written.
+    """
+    pdf_path, seg_from, seg_to, options = args
+    processor = _build_processor(options)
+    with _open_pdf(pdf_path) as doc:
+        base_name = processor.get_base_name(pdf_path)
+        extracted_text, csv_data = processor.process_pdf_pages(
+            doc, base_name, None, seg_from, seg_to
+        )
+    return seg_from, extracted_text, csv_data, processor.image_files
+
+
+class _ExtractionCanceled(Exception):
+    """Raised inside PDFExtractorThread to stop a run that has been interrupted."""
+
+
+class PDFExtractorThread(QThread):
+    """Worker thread for PDF extraction to prevent UI freezing."""
+
+    progress_update = pyqtSignal(int)
+    file_processed = pyqtSignal(str)
+    extraction_complete = pyqtSignal(str, list)
+    extraction_error = pyqtSignal(str)
 
-        with open(csv_file_path, "w", newline="", encoding="utf-8") as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(csv_data)
+    # Single PDFs longer than this are split into page ranges across processes
+    PAGE_RANGE_THRESHOLD = 64
+    # How often to check for interruption while waiting on worker processes
+    INTERRUPT_POLL_SECONDS = 0.2
 
-    def update_progress(
-        self, pdf_index: int, page_num: int, total_pages: int, total_pdfs: int
+    def __init__(
+        self,
+        pdf_paths: List[str],
+        output_path: str,
+        extract_text: bool = True,
+        extract_images: bool = False,
+        export_csv: bool = False,
+        use_cache: bool = True,
     ) -> None:
-        """Calculate and emit progress update."""
-        progress = int(((pdf_index + (page_num + 1) / total_pages) / total_pdfs) * 100)
-        self.progress_update.emit(progress)
+        """Initialize the PDF extraction thread.
+
+        Args:
+            pdf_paths: List of PDF file paths to process.
+            output_path: Directory to save extracted content.
+            extract_text: Whether to extract raw text.
+            extract_images: Whether to extract images.
+            export_csv: Whether to export data as CSV.
+            use_cache: Whether to reuse and store results in the output's .cache folder.
+        """
+        super().__init__()
+        self.pdf_paths = pdf_paths
+        self.output_path = output_path
+        self.extract_text = extract_text
+        self.extract_images = extract_images
+        self.export_csv = export_csv
+        self.use_cache = use_cache
+        self.last_progress = -1
+
+    @functools.cached_property
+    def field_extractor(self) -> FieldExtractor:
+        """Field configuration, loaded on first use in run() (off the UI thread)."""
+        return FieldExtractor()
+
+    def run(self) -> None:
+        """Main execution method for the thread, performs the PDF extraction."""
+        processed_files: List[str] = []
+        text_file_path = ""
+        self.last_progress = -1
+        try:
+            total_pdfs = len(self.pdf_paths)
+            if total_pdfs > 1:
+                processed_files = self.process_batch()
+            else:
+                for pdf_index, pdf_path in enumerate(self.pdf_paths):
+                    file_name, text_file_path = self.process_single_pdf(
+                        pdf_index, pdf_path, total_pdfs
+                    )
+                    processed_files.append(file_name)
+                    self.file_processed.emit(file_name)
+                    self.update_progress(int((pdf_index + 1) / total_pdfs * 100))
+
+            self.emit_completion_result(processed_files, total_pdfs, text_file_path)
+        except _ExtractionCanceled:
+            return  # The window is closing; nothing is waiting for the result
+        except Exception as e:
+            self.extraction_error.emit(f"Error extracting PDFs: {str(e)}")
+
+    def processor_options(self) -> ProcessorOptions:
+        """Return the picklable options used to build processors in workers."""
+        return (
+            self.output_path,
+            self.extract_text,
+            self.extract_images,
+            self.export_csv,
+            self.field_extractor.config_path,
+            self.use_cache,
+        )
+
+    def create_pool(self, processes: int) -> Any:
+        """Create a worker process pool for extraction.
+
+        MuPDF is not thread-safe, so parallelism has to come from processes.
+        Spawn rather than fork: forking a process that runs Qt threads is unsafe.
+        """
+        return multiprocessing.get_context("spawn").Pool(processes=processes)
+
+    def process_batch(self) -> List[str]:
+        """Process all PDFs across worker processes, one base name per task.
+
+        PDFs from different folders can share a base name and so the same output
+        files; each such group is processed in order by a single task. Names are
+        compared case-insensitively, as on Windows and macOS file systems.
+        """
+        total_pdfs = len(self.pdf_paths)
+        options = self.processor_options()
+        groups: Dict[str, List[str]] = {}
+        for pdf_path in self.pdf_paths:
+            base_name = os.path.splitext(os.path.basename(pdf_path))[0]
+            groups.setdefault(base_name.casefold(), []).append(pdf_path)
+        args = [(pdf_paths, options) for pdf_paths in groups.values()]
+        processed_files: List[str] = []
+
+        processes = min(multiprocessing.cpu_count(), len(args))
+        with self.create_pool(processes) as pool:
+            for base_names in self.iter_results(
+                pool.imap_unordered(_extract_pdf_group, args)
+            ):
+                for base_name in base_names:
+                    processed_files.append(f"{base_name}.pdf")
+                    self.file_processed.emit(processed_files[-1])
+                self.update_progress(int(len(processed_files) / total_pdfs * 100))
+        return processed_files
+
+    def process_single_pdf(
+        self, pdf_index: int, pdf_path: str, total_pdfs: int
+    ) -> Tuple[str, str]:
+        """Process a single PDF file.
+
+        Returns:
+            Tuple of the file name and the path of its text file, or an empty
+            string if text is not extracted.
+        """
+        with _open_pdf(pdf_path) as doc:
+            total_pages = len(doc)
+
+        # Progress is linear in pages, so precompute the offset and per-page step
+        base_progress = pdf_index * 100.0 / total_pdfs
+        page_step = 100.0 / (total_pdfs * max(total_pages, 1))
+
+        def page_done(page_num: int, _: int) -> None:
+            self.raise_if_interrupted()
+            self.update_progress(int(base_progress + (page_num + 1) * page_step))
+
+        processor = PDFProcessor(
+            self.output_path,
+            self.extract_text,
+            self.extract_images,
+            self.export_csv,
+            self.field_extractor,
+            page_done,
+            self.use_cache,
+        )
+
+        cpu = multiprocessing.cpu_count()
+        if total_pages > self.PAGE_RANGE_THRESHOLD and cpu > 1:
+            base_name = self.process_page_ranges(processor, pdf_path, total_pages, cpu)
+        else:
+            base_name = processor.process_pdf(pdf_path)
+        text_file_path = (
+            processor.get_text_file_path(base_name) if self.extract_text else ""
+        )
+        return f"{base_name}.pdf", text_file_path
+
+    def process_page_ranges(
+        self, processor: PDFProcessor, pdf_path: str, total_pages: int, cpu: int
+    ) -> str:
+        """Split a large PDF into page ranges, extract them in parallel and save the result.
+
+        Returns:
+            The PDF base name.
+        """
+        seg_size = total_pages // cpu + 1
+        options = self.processor_options()
+        args = [
+            (pdf_path, seg_from, min(seg_from + seg_size, total_pages), options)
+            for seg_from in range(0, total_pages, seg_size)
+        ]
+        base_name = processor.get_base_name(pdf_path)
+        cache_dir = processor.get_cache_dir(pdf_path, base_name)
+        if cache_dir is not None and os.path.isdir(cache_dir):
+            processor.restore_from_cache(cache_dir)
+            return base_name
+
+        csv_data: List[Dict[str, Any]] = []
+        image_files: List[str] = []
+
+        with (
+            self.create_pool(len(args)) as pool,
+            processor.open_text_file(base_name) as text_file,
+        ):
+            # imap yields segments in page order, so chunks are written directly
+            for done, (_, text_chunk, csv_rows, segment_images) in enumerate(
+                self.iter_results(pool.imap(_extract_page_range, args)), 1
+            ):
+                if text_file is not None:
+                    text_file.write(text_chunk)
+                csv_data.extend(csv_rows)
+                image_files.extend(segment_images)
+                self.update_progress(int(done / len(args) * 100))
+
+        processor.save_output_files(base_name, csv_data)
+        if cache_dir is not None:
+            processor.store_in_cache(
+                cache_dir, processor.get_output_files(base_name, csv_data, image_files)
+            )
+        return base_name
+
+    def raise_if_interrupted(self) -> None:
+        """Stop the run if requestInterruption() was called, e.g. on window close.
+
+        Raises:
+            _ExtractionCanceled: If the run has been interrupted.
+        """
+        if self.isInterruptionRequested():
+            raise _ExtractionCanceled()
+
+    def iter_results(self, results: Any) -> Iterator[Any]:
+        """Yield a pool's results, checking for interruption while waiting on them.
+
+        Leaving the pool's with block early terminates its worker processes.
+        """
+        while True:
+            try:
+                result = results.next(timeout=self.INTERRUPT_POLL_SECONDS)
+            except multiprocessing.TimeoutError:
+                self.raise_if_interrupted()
+                continue
+            except StopIteration:
+                return
+            self.raise_if_interrupted()
+            yield result
+
+    def update_progress(self, progress: int) -> None:
+        """Emit a progress update, skipping values that have already been sent.
+
+        Pages far outnumber the 101 distinct percentages, so this avoids queuing
+        redundant cross-thread signals to the UI.
+        """
+        if progress != self.last_progress:
+            self.last_progress = progress
+            self.progress_update.emit(progress)
 
     def emit_completion_result(
-        self, processed_files: List[str], total_pdfs: int
+        self, processed_files: List[str], total_pdfs: int, text_file_path: str
     ) -> None:
-        """Emit the appropriate completion signal."""
+        """Emit the appropriate completion signal.
+
+        Single-PDF runs send the text file path rather than the text itself, so
+        the document isn't copied across threads; the UI reads what it previews.
+        """
         if total_pdfs > 1:
             self.extraction_complete.emit("All PDFs processed.", processed_files)
         else:
-            self.extraction_complete.emit(
-                "", processed_files
-            )  # Text is handled separately
+            self.extraction_complete.emit(text_file_path, processed_files)
+
+
+def _iter_pdfs(
+    root: str, canceled: Optional[Callable[[], bool]] = None
+) -> Iterator[str]:
+    """Yield the paths of all PDF files under a directory, including subfolders.
+
+    Uses os.scandir so file types come from the cached directory entries rather
+    than extra stat calls. Like os.walk, unreadable directories are skipped and
+    directory symlinks are not followed.
+
+    Args:
+        root: Folder to search.
+        canceled: Checked before each directory; the walk stops once it is true.
+    """
+    stack = [root]
+    while stack and not (canceled is not None and canceled()):
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    # Lowercase only the suffix, not every non-PDF name in full
+                    elif entry.name[-4:].lower() == ".pdf" and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
+class PdfScanThread(QThread):
+    """Worker thread that searches a folder for PDFs without freezing the UI."""
+
+    scan_complete = pyqtSignal(list)
+
+    def __init__(self, folder_path: str, parent: Optional[QObject] = None) -> None:
+        """Initialize the folder scan thread.
+
+        Args:
+            folder_path: Folder to search, including subfolders.
+            parent: Owner of the thread, which keeps it alive while running.
+        """
+        super().__init__(parent)
+        self.folder_path = folder_path
+
+    def run(self) -> None:
+        """Walk the folder and emit the list of PDF paths found.
+
+        An interrupted scan stops at the next directory and emits nothing.
+        """
+        pdf_paths = list(_iter_pdfs(self.folder_path, self.isInterruptionRequested))
+        if not self.isInterruptionRequested():
+            self.scan_complete.emit(pdf_paths)
 
 
 class ConfigEditorDialog(QWidget):
@@ -338,6 +1357,7 @@ class ConfigEditorDialog(QWidget):
         self.name_edit.setMaximumHeight(30)
         self.pattern_edit = QTextEdit()
         self.required_checkbox = QCheckBox("Required Field")
+        self.ascii_checkbox = QCheckBox("ASCII-only Matching (faster)")
 
         details_group = QGroupBox("Field Details")
         details_layout = QVBoxLayout()
@@ -346,9 +1366,20 @@ class ConfigEditorDialog(QWidget):
         details_layout.addWidget(QLabel("Regex Pattern:"))
         details_layout.addWidget(self.pattern_edit)
         details_layout.addWidget(self.required_checkbox)
+        details_layout.addWidget(self.ascii_checkbox)
         details_group.setLayout(details_layout)
         layout.addWidget(details_group)
 
+        # Applies to every field
+        self.linear_time_checkbox = QCheckBox("Use re2 on ASCII-only pages")
+        self.linear_time_checkbox.setToolTip(
+            "Pages with any non-ASCII character, such as a ligature, curly quote or"
+            " accent, are still searched with Python's re."
+        )
+        self.linear_time_checkbox.setChecked(self.field_extractor.linear_time)
+        self.linear_time_checkbox.toggled.connect(self.linear_time_toggled)
+        layout.addWidget(self.linear_time_checkbox)
+
         # Buttons
         button_layout = QHBoxLayout()
         self.add_button = QPushButton("Add Field")
@@ -391,20 +1422,48 @@ class ConfigEditorDialog(QWidget):
             self.name_edit.setPlainText(field["name"])
             self.pattern_edit.setPlainText(field["pattern"])
             self.required_checkbox.setChecked(field.get("required", False))
+            self.ascii_checkbox.setChecked(field.get("ascii", False))
+
+    def linear_time_toggled(self, checked: bool) -> None:
+        """Switch between preferring re2 and PCRE2 for the patterns on ASCII pages.
+
+        Args:
+            checked: Whether re2 is preferred.
+        """
+        self.field_extractor.linear_time = checked
+        self.field_extractor.invalidate_patterns()
+
+    def validate_field(self, name: str, pattern: str, ascii_only: bool) -> bool:
+        """Check a field's name and pattern, warning the user if either is invalid."""
+        if not name or not pattern:
+            QMessageBox.warning(self, "Warning", "Field name and pattern are required.")
+            return False
+        try:
+            re.compile(pattern, FieldExtractor.get_pattern_flags(ascii_only))
+        except (re.error, ValueError) as e:
+            QMessageBox.warning(self, "Warning", f"Invalid pattern: {str(e)}")
+            return False
+        return True
 
     def add_field(self) -> None:
         """Add a new field to the configuration."""
         name: str = self.name_edit.toPlainText().strip()
         pattern: str = self.pattern_edit.toPlainText().strip()
         required: bool = self.required_checkbox.isChecked()
+        ascii_only: bool = self.ascii_checkbox.isChecked()
 
-        if not name or not pattern:
-            QMessageBox.warning(self, "Warning", "Field name and pattern are required.")
+        if not self.validate_field(name, pattern, ascii_only):
             return
 
         self.field_extractor.fields.append(
-            {"name": name, "pattern": pattern, "required": required}
+            {
+                "name": name,
+                "pattern": pattern,
+                "required": required,
+                "ascii": ascii_only,
+            }
         )
+        self.field_extractor.invalidate_patterns()
         self.refresh_field_list()
 
     def update_field(self) -> None:
@@ -417,16 +1476,18 @@ class ConfigEditorDialog(QWidget):
         name: str = self.name_edit.toPlainText().strip()
         pattern: str = self.pattern_edit.toPlainText().strip()
         required: bool = self.required_checkbox.isChecked()
+        ascii_only: bool = self.ascii_checkbox.isChecked()
 
-        if not name or not pattern:
-            QMessageBox.warning(self, "Warning", "Field name and pattern are required.")
+        if not self.validate_field(name, pattern, ascii_only):
             return
 
         self.field_extractor.fields[index] = {
             "name": name,
             "pattern": pattern,
             "required": required,
+            "ascii": ascii_only,
         }
+        self.field_extractor.invalidate_patterns()
         self.refresh_field_list()
 
     def remove_field(self) -> None:
@@ -437,6 +1498,7 @@ class ConfigEditorDialog(QWidget):
 
         index: int = self.field_list.row(current)
         self.field_extractor.fields.pop(index)
+        self.field_extractor.invalidate_patterns()
         self.refresh_field_list()
 
     def save_config(self) -> None:
@@ -450,9 +1512,34 @@ class ConfigEditorDialog(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to save config: {str(e)}")
 
 
+@functools.cache
+def _dark_palette() -> QPalette:
+    """Return the palette used for the application's dark theme, built once.
+
+    Must first be called after the QApplication exists: QPalette() copies the
+    application palette, which supplies the roles not overridden here.
+    """
+    dark_palette = QPalette()
+    dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.WindowText, Qt.GlobalColor.white)
+    dark_palette.setColor(QPalette.Base, QColor(35, 35, 35))
+    dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.ToolTipBase, Qt.GlobalColor.white)
+    dark_palette.setColor(QPalette.ToolTipText, Qt.GlobalColor.white)
+    dark_palette.setColor(QPalette.Text, Qt.GlobalColor.white)
+    dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
+    dark_palette.setColor(QPalette.ButtonText, Qt.GlobalColor.white)
+    dark_palette.setColor(QPalette.BrightText, Qt.GlobalColor.red)
+    dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
+    return dark_palette
+
+
 class PDFExtractorApp(QMainWindow):
     """Main application window for PDF Extractor."""
 
+    # Characters of extracted text shown in the preview; the full text is on disk
+    PREVIEW_CHARS = 200_000
+
     def __init__(self) -> None:
         """Initialize the main application window."""
         super().__init__()
@@ -462,25 +1549,19 @@ class PDFExtractorApp(QMainWindow):
 
         self.pdf_paths: List[str] = []
         self.output_dir: Optional[str] = None
-        self.field_extractor = FieldExtractor()
+        self.scan_thread: Optional[PdfScanThread] = None
+        self.extraction_thread: Optional[PDFExtractorThread] = None
 
         self.init_ui()
 
+    @functools.cached_property
+    def field_extractor(self) -> FieldExtractor:
+        """Field configuration for the config editor, loaded when first opened."""
+        return FieldExtractor()
+
     def set_dark_mode(self) -> None:
         """Configure the application to use a dark theme."""
-        dark_palette = QPalette()
-        dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.WindowText, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.Base, QColor(35, 35, 35))
-        dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ToolTipBase, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.ToolTipText, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.Text, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        dark_palette.setColor(QPalette.ButtonText, Qt.GlobalColor.white)
-        dark_palette.setColor(QPalette.BrightText, Qt.GlobalColor.red)
-        dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        QApplication.setPalette(dark_palette)
+        QApplication.setPalette(_dark_palette())
 
     def init_ui(self) -> None:
         """Initialize the user interface components."""
@@ -533,6 +1614,10 @@ class PDFExtractorApp(QMainWindow):
         self.extract_images_checkbox = QCheckBox("Extract Images")
         options_layout.addWidget(self.extract_images_checkbox)
 
+        self.use_cache_checkbox = QCheckBox("Reuse Cached Results")
+        self.use_cache_checkbox.setChecked(True)
+        options_layout.addWidget(self.use_cache_checkbox)
+
         options_group.setLayout(options_layout)
         main_layout.addWidget(options_group)
 
@@ -551,6 +1636,8 @@ class PDFExtractorApp(QMainWindow):
         main_layout.addWidget(self.extract_button)
 
         self.processed_list = QListWidget()
+        # Every row is one line of text, so the view can skip measuring each item
+        self.processed_list.setUniformItemSizes(True)
         main_layout.addWidget(QLabel("Processed Files:"))
         main_layout.addWidget(self.processed_list)
 
@@ -563,7 +1650,7 @@ class PDFExtractorApp(QMainWindow):
         self.preview_group = QGroupBox("Extracted Text Preview")
         preview_layout = QVBoxLayout()
 
-        self.preview_text = QTextEdit()
+        self.preview_text = QPlainTextEdit()
         self.preview_text.setReadOnly(True)
         self.preview_text.setMinimumHeight(900)
         preview_layout.addWidget(self.preview_text)
@@ -573,6 +1660,24 @@ class PDFExtractorApp(QMainWindow):
 
         self.setCentralWidget(main_widget)
 
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Stop a running extraction and any folder scans before the window closes.
+
+        Otherwise the threads would be destroyed while running when the
+        application exits. Extraction stops after the current page, or at once
+        when waiting on worker processes, which are terminated. Scans stop at the
+        next directory, including ones superseded by a mode change.
+        """
+        if self.extraction_thread is not None and self.extraction_thread.isRunning():
+            self.extraction_thread.requestInterruption()
+            self.extraction_thread.wait()
+        scan_threads = self.findChildren(PdfScanThread)
+        for scan_thread in scan_threads:
+            scan_thread.requestInterruption()
+        for scan_thread in scan_threads:
+            scan_thread.wait()
+        super().closeEvent(event)
+
     def open_config_editor(self) -> None:
         """Open the field configuration editor dialog."""
         self.config_editor = ConfigEditorDialog(self.field_extractor)
@@ -586,6 +1691,11 @@ class PDFExtractorApp(QMainWindow):
         """Handle changes to the processing mode (single file vs folder)."""
         self.file_path_label.setText("No file or folder selected")
         self.pdf_paths = []
+        if self.scan_thread is not None:
+            # Discard the results of any scan in progress; closeEvent still waits
+            self.scan_thread.requestInterruption()
+            self.scan_thread = None
+        self.file_select_button.setEnabled(True)
         self.check_extract_button()
 
     def select_file_or_folder(self) -> None:
@@ -602,37 +1712,60 @@ class PDFExtractorApp(QMainWindow):
                 self, "Select Folder Containing PDFs"
             )
             if folder_path:
-                self.pdf_paths = []
-                # Recursively walk through all subdirectories
-                for root, dirs, files in os.walk(folder_path):
-                    for file in files:
-                        if file.lower().endswith(".pdf"):
-                            full_path = os.path.join(root, file)
-                            self.pdf_paths.append(full_path)
-
-                if not self.pdf_paths:
-                    self.file_path_label.setText(
-                        "No PDF files found in selected folder or subfolders"
-                    )
-                else:
-                    # Warn if many PDFs found
-                    if len(self.pdf_paths) > 200:
-                        reply = QMessageBox.question(
-                            self,
-                            "Many PDFs Found",
-                            f"Found {len(self.pdf_paths)} PDF files. Processing may take a while. Continue?",
-                            QMessageBox.Yes | QMessageBox.No,
-                            QMessageBox.No,
-                        )
-                        if reply == QMessageBox.No:
-                            self.pdf_paths = []
-                            self.file_path_label.setText("Operation canceled")
-                            self.check_extract_button()
-                            return
-
-                    self.file_path_label.setText(
-                        f"{len(self.pdf_paths)} PDF file(s) found in folder and subfolders"
-                    )
+                self.start_folder_scan(folder_path)
+
+        self.check_extract_button()
+
+    def start_folder_scan(self, folder_path: str) -> None:
+        """Search the selected folder and its subfolders for PDFs on a worker thread.
+
+        Args:
+            folder_path: The folder selected by the user.
+        """
+        self.pdf_paths = []
+        self.file_path_label.setText("Searching folder and subfolders for PDF files...")
+        self.file_select_button.setEnabled(False)
+
+        self.scan_thread = PdfScanThread(folder_path, self)
+        self.scan_thread.scan_complete.connect(self.on_folder_scan_complete)
+        self.scan_thread.finished.connect(self.scan_thread.deleteLater)
+        self.scan_thread.start()
+
+    def on_folder_scan_complete(self, pdf_paths: List[str]) -> None:
+        """Handle the PDFs found by a folder scan.
+
+        Args:
+            pdf_paths: Paths of all PDF files found in the folder and subfolders.
+        """
+        if self.sender() is not self.scan_thread:
+            return  # Superseded by a mode change while scanning
+        self.scan_thread = None
+        self.file_select_button.setEnabled(True)
+        self.pdf_paths = pdf_paths
+
+        if not self.pdf_paths:
+            self.file_path_label.setText(
+                "No PDF files found in selected folder or subfolders"
+            )
+        else:
+            # Warn if many PDFs found
+            if len(self.pdf_paths) > 200:
+                reply = QMessageBox.question(
+                    self,
+                    "Many PDFs Found",
+                    f"Found {len(self.pdf_paths)} PDF files. Processing may take a while. Continue?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.No,
+                )
+                if reply == QMessageBox.No:
+                    self.pdf_paths = []
+                    self.file_path_label.setText("Operation canceled")
+                    self.check_extract_button()
+                    return
+
+            self.file_path_label.setText(
+                f"{len(self.pdf_paths)} PDF file(s) found in folder and subfolders"
+            )
 
         self.check_extract_button()
 
@@ -684,9 +1817,11 @@ class PDFExtractorApp(QMainWindow):
             self.extract_text_checkbox.isChecked(),
             self.extract_images_checkbox.isChecked(),
             self.export_csv_checkbox.isChecked(),
+            self.use_cache_checkbox.isChecked(),
         )
 
         self.extraction_thread.progress_update.connect(self.update_progress)
+        self.extraction_thread.file_processed.connect(self.processed_list.addItem)
         self.extraction_thread.extraction_complete.connect(self.on_extraction_complete)
         self.extraction_thread.extraction_error.connect(self.on_extraction_error)
 
@@ -701,21 +1836,21 @@ class PDFExtractorApp(QMainWindow):
         self.progress_bar.setValue(value)
 
     def on_extraction_complete(
-        self, extracted_text: str, processed_files: List[str]
+        self, text_file_path: str, processed_files: List[str]
     ) -> None:
         """Handle completion of PDF extraction.
 
         Args:
-            extracted_text: The extracted text content (for single file mode).
-            processed_files: List of processed file names.
+            text_file_path: Path of the extracted text file (for single file mode).
+            processed_files: List of processed file names (already listed as each finished).
         """
         if (
             self.extract_text_checkbox.isChecked()
             and self.mode_combo.currentText() == "Single PDF"
+            and text_file_path
         ):
-            self.preview_text.setText(extracted_text)
+            self.show_preview(text_file_path)
 
-        self.processed_list.addItems(processed_files)
         self.extract_button.setEnabled(True)
 
         QMessageBox.information(
@@ -724,6 +1859,14 @@ class PDFExtractorApp(QMainWindow):
             f"PDF extraction completed successfully.\n\nFiles saved to: {self.output_dir}",
         )
 
+    def show_preview(self, text_file_path: str) -> None:
+        """Show the start of an extracted text file in the preview panel."""
+        try:
+            with open(text_file_path, "r", encoding="utf-8") as text_file:
+                self.preview_text.setPlainText(text_file.read(self.PREVIEW_CHARS))
+        except OSError as e:
+            print(f"Warning reading preview {text_file_path}: {str(e)}")
+
     def on_extraction_error(self, error_message: str) -> None:
         """Handle extraction errors.
 
@@ -735,6 +1878,7 @@ class PDFExtractorApp(QMainWindow):
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = PDFExtractorApp()
     window.show()